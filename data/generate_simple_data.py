@@ -5,176 +5,247 @@ Generates realistic healthcare billing data with intentional anomalies for analy
 
 import pandas as pd
 import numpy as np
-import random
-from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# Use Arrow for Parquet output and its multithreaded CSV writer when available
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+RANDOM_SEED = 42
+
+# Define realistic medical procedures and costs
+PROCEDURES = {
+    'Emergency Room Visit': {'base_cost': 1200, 'variance': 400, 'frequency': 0.15},
+    'Routine Checkup': {'base_cost': 250, 'variance': 50, 'frequency': 0.25},
+    'Blood Test': {'base_cost': 150, 'variance': 30, 'frequency': 0.20},
+    'X-Ray': {'base_cost': 300, 'variance': 75, 'frequency': 0.12},
+    'MRI Scan': {'base_cost': 2500, 'variance': 500, 'frequency': 0.05},
+    'CT Scan': {'base_cost': 1800, 'variance': 300, 'frequency': 0.08},
+    'Surgery - Minor': {'base_cost': 5000, 'variance': 1000, 'frequency': 0.04},
+    'Surgery - Major': {'base_cost': 25000, 'variance': 8000, 'frequency': 0.02},
+    'Physical Therapy': {'base_cost': 180, 'variance': 40, 'frequency': 0.09}
+}
+
+# Insurance providers with different coverage rates
+INSURANCE_PROVIDERS = {
+    'BlueCross BlueShield': {'coverage_rate': 0.80, 'frequency': 0.25},
+    'Aetna': {'coverage_rate': 0.75, 'frequency': 0.20},
+    'UnitedHealth': {'coverage_rate': 0.82, 'frequency': 0.22},
+    'Cigna': {'coverage_rate': 0.78, 'frequency': 0.15},
+    'Medicare': {'coverage_rate': 0.85, 'frequency': 0.10},
+    'Medicaid': {'coverage_rate': 0.90, 'frequency': 0.08}
+}
+
+# Parallel lookup arrays, built once and gathered by integer index per record
+PROCEDURE_NAMES = np.array(list(PROCEDURES))
+PROCEDURE_FREQUENCIES = np.array([info['frequency'] for info in PROCEDURES.values()])
+PROCEDURE_BASE_COSTS = np.array([info['base_cost'] for info in PROCEDURES.values()], dtype=np.float64)
+PROCEDURE_VARIANCES = np.array([info['variance'] for info in PROCEDURES.values()], dtype=np.float64)
+
+INSURANCE_NAMES = np.array(list(INSURANCE_PROVIDERS))
+INSURANCE_FREQUENCIES = np.array([info['frequency'] for info in INSURANCE_PROVIDERS.values()])
+INSURANCE_COVERAGE_RATES = np.array([info['coverage_rate'] for info in INSURANCE_PROVIDERS.values()])
+
+# Medical departments
+DEPARTMENTS = np.array([
+    'Emergency Medicine', 'Internal Medicine', 'Cardiology', 'Orthopedics',
+    'Radiology', 'Surgery', 'Pediatrics', 'Neurology', 'Oncology', 'Psychiatry'
+])
+
+# Simple name generator
+FIRST_NAMES = np.array(['John', 'Jane', 'Michael', 'Sarah', 'David', 'Lisa', 'Robert', 'Mary', 'James', 'Patricia'])
+LAST_NAMES = np.array(['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez'])
+
+# Diagnosis codes (ICD-10 style)
+DIAGNOSIS_CODES = np.array([
+    'Z00.00', 'I10', 'E11.9', 'M79.1', 'R53.83', 'K21.9',
+    'F41.1', 'M25.511', 'N39.0', 'R50.9', 'H52.4', 'J06.9'
+])
+
+# Claim outcomes and admission types with their frequencies
+CLAIM_STATUSES = np.array(['Paid', 'Pending', 'Denied'])
+CLAIM_STATUS_FREQUENCIES = np.array([0.85, 0.10, 0.05])
+ADMISSION_TYPES = np.array(['Outpatient', 'Inpatient', 'Emergency'])
+ADMISSION_TYPE_FREQUENCIES = np.array([0.70, 0.20, 0.10])
+
+# Low-cardinality columns are generated as integer codes into these labels
+# and stored with the category dtype
+CATEGORICAL_LABELS = {
+    'procedure_name': PROCEDURE_NAMES,
+    'primary_diagnosis': DIAGNOSIS_CODES,
+    'department': DEPARTMENTS,
+    'insurance_provider': INSURANCE_NAMES,
+    'claim_status': CLAIM_STATUSES,
+    'admission_type': ADMISSION_TYPES
+}
+
+# Records are generated in fixed-size shards so output does not depend on the worker count
+RECORDS_PER_CHUNK = 10000
+
+def _compute_costs(rng, proc_idx, ins_idx):
+    """
+    Compute billed, insurance-paid and patient amounts for one shard, in place where possible
+    """
+    num_records = len(proc_idx)
+    
+    # Base cost calculation
+    total_billed = rng.normal(PROCEDURE_BASE_COSTS[proc_idx], PROCEDURE_VARIANCES[proc_idx])
+    np.maximum(total_billed, 50, out=total_billed)  # Minimum cost
+    
+    # Insurance payment reuses one buffer for the payment factor and coverage rate
+    insurance_paid = rng.uniform(0.85, 1.0, num_records)
+    insurance_paid *= INSURANCE_COVERAGE_RATES[ins_idx]
+    insurance_paid *= total_billed
+    patient_responsibility = total_billed - insurance_paid
+    
+    for amounts in (total_billed, insurance_paid, patient_responsibility):
+        np.round(amounts, 2, out=amounts)
+    
+    return total_billed, insurance_paid, patient_responsibility
+
+def _generate_chunk(seed, start, num_records, start_date):
+    """
+    Generate one shard of billing records as a dict of column arrays
+    (categorical columns hold integer codes into CATEGORICAL_LABELS)
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Claim and patient identifiers
+    record_ids = np.arange(start, start + num_records, dtype=np.int64)
+    claim_id = np.char.add("CLM", np.char.zfill((20240000 + record_ids).astype(str), 8))
+    patient_id = np.char.add("P", np.char.zfill((10000 + record_ids).astype(str), 6))
+    
+    # Patient information
+    patient_age = np.clip(rng.normal(45, 18, num_records).astype(np.int32), 1, 95)
+    
+    # Procedure selection based on frequency
+    proc_idx = rng.choice(len(PROCEDURE_NAMES), size=num_records, p=PROCEDURE_FREQUENCIES)
+    
+    # Insurance information
+    ins_idx = rng.choice(len(INSURANCE_NAMES), size=num_records, p=INSURANCE_FREQUENCIES)
+    
+    # Calculate costs
+    total_billed, insurance_paid, patient_responsibility = _compute_costs(rng, proc_idx, ins_idx)
+    
+    # Date range (last 2 years)
+    service_date = start_date + rng.integers(0, 731, num_records).astype('timedelta64[D]')
+    
+    # Department, provider and diagnosis
+    dept_idx = rng.integers(0, len(DEPARTMENTS), num_records)
+    provider_id = np.char.add("DR", rng.integers(1000, 10000, num_records).astype(str))
+    provider_name = np.char.add(
+        np.char.add("Dr. ", FIRST_NAMES[rng.integers(0, len(FIRST_NAMES), num_records)]),
+        np.char.add(" ", LAST_NAMES[rng.integers(0, len(LAST_NAMES), num_records)])
+    )
+    diag_idx = rng.integers(0, len(DIAGNOSIS_CODES), num_records)
+    
+    # Claim outcome and admission type
+    status_idx = rng.choice(len(CLAIM_STATUSES), size=num_records, p=CLAIM_STATUS_FREQUENCIES)
+    admission_idx = rng.choice(len(ADMISSION_TYPES), size=num_records, p=ADMISSION_TYPE_FREQUENCIES)
+    
+    # Length of stay: 30% of claims span multiple days
+    multi_day = rng.random(num_records) < 0.3
+    length_of_stay = np.where(multi_day, rng.integers(1, 16, num_records, dtype=np.int16), 1).astype(np.int16)
+    
+    return {
+        'claim_id': claim_id,
+        'patient_id': patient_id,
+        'patient_age': patient_age,
+        'service_date': service_date,
+        'procedure_name': proc_idx,
+        'procedure_code': np.char.add("CPT", rng.integers(10000, 100000, num_records).astype(str)),
+        'primary_diagnosis': diag_idx,
+        'department': dept_idx,
+        'provider_id': provider_id,
+        'provider_name': provider_name,
+        'insurance_provider': ins_idx,
+        'total_billed_amount': total_billed,
+        'insurance_paid_amount': insurance_paid,
+        'patient_responsibility': patient_responsibility,
+        'claim_status': status_idx,
+        'admission_type': admission_idx,
+        'length_of_stay': length_of_stay
+    }
 
-def generate_healthcare_data(num_records=10000):
+def generate_healthcare_data(num_records=10000, max_workers=None, seed=RANDOM_SEED):
     """
     Generate comprehensive healthcare billing dataset
     """
     print(f"Generating {num_records:,} healthcare billing records...")
     
-    # Define realistic medical procedures and costs
-    procedures = {
-        'Emergency Room Visit': {'base_cost': 1200, 'variance': 400, 'frequency': 0.15},
-        'Routine Checkup': {'base_cost': 250, 'variance': 50, 'frequency': 0.25},
-        'Blood Test': {'base_cost': 150, 'variance': 30, 'frequency': 0.20},
-        'X-Ray': {'base_cost': 300, 'variance': 75, 'frequency': 0.12},
-        'MRI Scan': {'base_cost': 2500, 'variance': 500, 'frequency': 0.05},
-        'CT Scan': {'base_cost': 1800, 'variance': 300, 'frequency': 0.08},
-        'Surgery - Minor': {'base_cost': 5000, 'variance': 1000, 'frequency': 0.04},
-        'Surgery - Major': {'base_cost': 25000, 'variance': 8000, 'frequency': 0.02},
-        'Physical Therapy': {'base_cost': 180, 'variance': 40, 'frequency': 0.09}
-    }
+    # Split the records into shards, each with an independent child seed
+    starts = list(range(0, num_records, RECORDS_PER_CHUNK))
+    sizes = [min(RECORDS_PER_CHUNK, num_records - start) for start in starts]
+    *seeds, anomaly_seed = np.random.SeedSequence(seed).spawn(len(starts) + 1)
+    rng = np.random.default_rng(anomaly_seed)
     
-    # Insurance providers with different coverage rates
-    insurance_providers = {
-        'BlueCross BlueShield': {'coverage_rate': 0.80, 'frequency': 0.25},
-        'Aetna': {'coverage_rate': 0.75, 'frequency': 0.20},
-        'UnitedHealth': {'coverage_rate': 0.82, 'frequency': 0.22},
-        'Cigna': {'coverage_rate': 0.78, 'frequency': 0.15},
-        'Medicare': {'coverage_rate': 0.85, 'frequency': 0.10},
-        'Medicaid': {'coverage_rate': 0.90, 'frequency': 0.08}
-    }
+    # Resolve the service date window once so every shard shares the same range
+    start_date = np.datetime64(datetime.now().date()) - np.timedelta64(730, 'D')
     
-    # Medical departments
-    departments = [
-        'Emergency Medicine', 'Internal Medicine', 'Cardiology', 'Orthopedics',
-        'Radiology', 'Surgery', 'Pediatrics', 'Neurology', 'Oncology', 'Psychiatry'
-    ]
+    if len(starts) == 1:
+        chunks = [_generate_chunk(seeds[0], starts[0], sizes[0], start_date)]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunks = list(executor.map(_generate_chunk, seeds, starts, sizes,
+                                       [start_date] * len(starts)))
     
-    # Simple name generator
-    first_names = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Lisa', 'Robert', 'Mary', 'James', 'Patricia']
-    last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez']
-    
-    # Generate base data
-    data = []
-    
-    for i in range(num_records):
-        # Patient information
-        patient_id = f"P{10000 + i:06d}"
-        patient_age = np.random.normal(45, 18)
-        patient_age = max(1, min(95, int(patient_age)))
-        
-        # Procedure selection based on frequency
-        procedure_name = np.random.choice(
-            list(procedures.keys()),
-            p=[procedures[p]['frequency'] for p in procedures.keys()]
-        )
-        procedure_info = procedures[procedure_name]
-        
-        # Base cost calculation
-        base_cost = np.random.normal(
-            procedure_info['base_cost'],
-            procedure_info['variance']
-        )
-        base_cost = max(50, base_cost)  # Minimum cost
-        
-        # Insurance information
-        insurance_name = np.random.choice(
-            list(insurance_providers.keys()),
-            p=[insurance_providers[p]['frequency'] for p in insurance_providers.keys()]
-        )
-        coverage_rate = insurance_providers[insurance_name]['coverage_rate']
-        
-        # Calculate costs
-        total_billed = base_cost
-        insurance_paid = total_billed * coverage_rate * np.random.uniform(0.85, 1.0)
-        patient_responsibility = total_billed - insurance_paid
-        
-        # Date range (last 2 years)
-        start_date = datetime.now() - timedelta(days=730)
-        service_date = start_date + timedelta(days=random.randint(0, 730))
-        
-        # Department
-        department = random.choice(departments)
-        
-        # Provider information
-        provider_id = f"DR{random.randint(1000, 9999)}"
-        
-        # Generate provider name
-        provider_name = f"Dr. {random.choice(first_names)} {random.choice(last_names)}"
-        
-        # Diagnosis codes (ICD-10 style)
-        diagnosis_codes = [
-            'Z00.00', 'I10', 'E11.9', 'M79.1', 'R53.83', 'K21.9',
-            'F41.1', 'M25.511', 'N39.0', 'R50.9', 'H52.4', 'J06.9'
-        ]
-        primary_diagnosis = random.choice(diagnosis_codes)
-        
-        data.append({
-            'claim_id': f"CLM{20240000 + i:08d}",
-            'patient_id': patient_id,
-            'patient_age': patient_age,
-            'service_date': service_date.strftime('%Y-%m-%d'),
-            'procedure_name': procedure_name,
-            'procedure_code': f"CPT{random.randint(10000, 99999)}",
-            'primary_diagnosis': primary_diagnosis,
-            'department': department,
-            'provider_id': provider_id,
-            'provider_name': provider_name,
-            'insurance_provider': insurance_name,
-            'total_billed_amount': round(total_billed, 2),
-            'insurance_paid_amount': round(insurance_paid, 2),
-            'patient_responsibility': round(patient_responsibility, 2),
-            'claim_status': np.random.choice(['Paid', 'Pending', 'Denied'], p=[0.85, 0.10, 0.05]),
-            'admission_type': np.random.choice(['Outpatient', 'Inpatient', 'Emergency'], p=[0.70, 0.20, 0.10]),
-            'length_of_stay': random.randint(1, 15) if np.random.random() < 0.3 else 1
-        })
-    
-    df = pd.DataFrame(data)
+    # One contiguous 1-D array per column keeps the frame column-major; avoid
+    # stacking columns into a single 2-D (row-major) array here
+    columns = {col: np.concatenate([chunk[col] for chunk in chunks]) for col in chunks[0]}
+    for col, labels in CATEGORICAL_LABELS.items():
+        columns[col] = pd.Categorical.from_codes(columns[col], categories=labels)
+    df = pd.DataFrame(columns, copy=False)
     
     # Introduce realistic anomalies (5% of data)
     anomaly_count = int(num_records * 0.05)
-    anomaly_indices = np.random.choice(df.index, anomaly_count, replace=False)
+    anomaly_indices = rng.choice(len(df), anomaly_count, replace=False)
     
     print(f"Introducing {anomaly_count:,} anomalies...")
     
-    for idx in anomaly_indices:
-        anomaly_type = np.random.choice([
-            'billing_error', 'duplicate_claim', 'unusual_cost', 'fraud_indicator'
-        ])
-        
-        if anomaly_type == 'billing_error':
-            # Incorrect billing amounts
-            df.loc[idx, 'total_billed_amount'] *= np.random.uniform(2.0, 5.0)
-        
-        elif anomaly_type == 'duplicate_claim':
-            # Create near-duplicate claims
-            if idx < len(df) - 1:
-                df.loc[idx + 1, 'patient_id'] = df.loc[idx, 'patient_id']
-                df.loc[idx + 1, 'procedure_name'] = df.loc[idx, 'procedure_name']
-                df.loc[idx + 1, 'service_date'] = df.loc[idx, 'service_date']
-        
-        elif anomaly_type == 'unusual_cost':
-            # Unusually high costs for routine procedures
-            if 'Routine' in df.loc[idx, 'procedure_name']:
-                df.loc[idx, 'total_billed_amount'] *= np.random.uniform(10.0, 20.0)
-        
-        elif anomaly_type == 'fraud_indicator':
-            # Multiple expensive procedures same day
-            df.loc[idx, 'procedure_name'] = 'Surgery - Major'
-            df.loc[idx, 'total_billed_amount'] = np.random.uniform(50000, 100000)
+    anomaly_types = rng.choice(4, size=anomaly_count)
+    billing_error_idx = anomaly_indices[anomaly_types == 0]
+    duplicate_idx = anomaly_indices[anomaly_types == 1]
+    unusual_cost_idx = anomaly_indices[anomaly_types == 2]
+    fraud_idx = anomaly_indices[anomaly_types == 3]
+    
+    # Incorrect billing amounts
+    df.loc[billing_error_idx, 'total_billed_amount'] *= rng.uniform(2.0, 5.0, len(billing_error_idx))
+    
+    # Create near-duplicate claims
+    duplicate_idx = duplicate_idx[duplicate_idx < len(df) - 1]
+    duplicate_cols = df.columns.get_indexer(['patient_id', 'procedure_name', 'service_date'])
+    df.iloc[duplicate_idx + 1, duplicate_cols] = df.iloc[duplicate_idx, duplicate_cols].values
+    
+    # Unusually high costs for routine procedures
+    routine_mask = df.loc[unusual_cost_idx, 'procedure_name'].str.contains('Routine').values
+    routine_idx = unusual_cost_idx[routine_mask]
+    df.loc[routine_idx, 'total_billed_amount'] *= rng.uniform(10.0, 20.0, len(routine_idx))
+    
+    # Multiple expensive procedures same day
+    df.loc[fraud_idx, 'procedure_name'] = 'Surgery - Major'
+    df.loc[fraud_idx, 'total_billed_amount'] = rng.uniform(50000, 100000, len(fraud_idx))
     
     # Add calculated fields
-    df['payment_rate'] = df['insurance_paid_amount'] / df['total_billed_amount']
-    df['cost_per_day'] = df['total_billed_amount'] / df['length_of_stay']
-    df['month_year'] = pd.to_datetime(df['service_date']).dt.to_period('M').astype(str)
+    total_billed = df['total_billed_amount'].to_numpy()
+    df['payment_rate'] = df['insurance_paid_amount'].to_numpy() / total_billed
+    df['cost_per_day'] = total_billed / df['length_of_stay'].to_numpy()
+    df['month_year'] = df['service_date'].to_numpy().astype('datetime64[M]').astype(str)
     
     print("Healthcare billing data generated successfully!")
     return df
 
-def generate_provider_data(num_providers=100):
+def generate_provider_data(num_providers=100, seed=RANDOM_SEED):
     """
     Generate healthcare provider reference data
     """
     print(f"Generating {num_providers} provider records...")
+    rng = np.random.default_rng(seed)
     
     specialties = [
         'Family Medicine', 'Internal Medicine', 'Emergency Medicine', 'Cardiology',
@@ -188,28 +259,48 @@ def generate_provider_data(num_providers=100):
     last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
                   'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin']
     
-    providers = []
-    for i in range(num_providers):
-        provider_id = f"DR{1000 + i:04d}"
-        years_experience = random.randint(1, 40)
-        
-        providers.append({
-            'provider_id': provider_id,
-            'provider_name': f"Dr. {random.choice(first_names)} {random.choice(last_names)}",
-            'specialty': random.choice(specialties),
-            'years_experience': years_experience,
-            'medical_school': f"{random.choice(['Harvard', 'Johns Hopkins', 'Mayo', 'Stanford', 'UCLA'])} Medical School",
-            'board_certified': np.random.choice([True, False], p=[0.9, 0.1]),
-            'hospital_affiliation': f"{random.choice(['General', 'Memorial', 'Regional', 'University', 'Community'])} Medical Center",
-            'license_state': random.choice(['CA', 'NY', 'TX', 'FL', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI']),
-            'npi_number': f"{random.randint(1000000000, 9999999999)}"
-        })
-    
-    return pd.DataFrame(providers)
-
-def main():
+    schools = np.array(['Harvard', 'Johns Hopkins', 'Mayo', 'Stanford', 'UCLA'])
+    hospitals = np.array(['General', 'Memorial', 'Regional', 'University', 'Community'])
+    states = ['CA', 'NY', 'TX', 'FL', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI']
+    
+    return pd.DataFrame({
+        'provider_id': np.char.add("DR", (1000 + np.arange(num_providers)).astype(str)),
+        'provider_name': np.char.add(
+            np.char.add("Dr. ", rng.choice(first_names, num_providers)),
+            np.char.add(" ", rng.choice(last_names, num_providers))
+        ),
+        'specialty': rng.choice(specialties, num_providers),
+        'years_experience': rng.integers(1, 41, num_providers),
+        'medical_school': np.char.add(rng.choice(schools, num_providers), " Medical School"),
+        'board_certified': rng.choice([True, False], num_providers, p=[0.9, 0.1]),
+        'hospital_affiliation': np.char.add(rng.choice(hospitals, num_providers), " Medical Center"),
+        'license_state': rng.choice(states, num_providers),
+        'npi_number': rng.integers(10**9, 10**10, size=num_providers, dtype=np.int64).astype(str)
+    }, copy=False)
+
+def save_billing_csv(df, path):
+    """
+    Write the billing dataset to CSV, formatting columns in C++ via pyarrow when available
+    """
+    if not PYARROW_AVAILABLE:
+        # Amounts are rounded at generation time; a global float_format would also
+        # truncate the payment_rate and cost_per_day ratios, so only batch the rows
+        df.to_csv(path, index=False, chunksize=10000)
+        return
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Keep service dates as YYYY-MM-DD instead of full timestamps
+    date_col = table.schema.get_field_index('service_date')
+    table = table.set_column(date_col, 'service_date', table['service_date'].cast(pa.date32()))
+    pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(include_header=True))
+
+def main(write_csv=True):
     """
     Main function to generate all datasets
+    
+    The billing data is written as Parquet when pyarrow is available; the CSV
+    copy used by the SQL, Power BI and notebook workflows can be turned off
+    with write_csv=False.
     """
     print("=== Healthcare Billing Data Generator ===\n")
     
@@ -222,8 +313,14 @@ def main():
     # Save datasets
     print("\nSaving datasets...")
     
-    billing_df.to_csv('healthcare_billing_data.csv', index=False)
-    print(f"✓ Saved healthcare_billing_data.csv ({len(billing_df):,} records)")
+    if write_csv or not PYARROW_AVAILABLE:
+        save_billing_csv(billing_df, 'healthcare_billing_data.csv')
+        print(f"✓ Saved healthcare_billing_data.csv ({len(billing_df):,} records)")
+    
+    if PYARROW_AVAILABLE:
+        billing_df.to_parquet('healthcare_billing_data.parquet', engine='pyarrow',
+                              compression='snappy', index=False)
+        print(f"✓ Saved healthcare_billing_data.parquet ({len(billing_df):,} records)")
     
     provider_df.to_csv('provider_reference_data.csv', index=False)
     print(f"✓ Saved provider_reference_data.csv ({len(provider_df):,} records)")
@@ -231,7 +328,7 @@ def main():
     # Generate summary statistics
     print("\n=== Dataset Summary ===")
     print(f"Total Claims: {len(billing_df):,}")
-    print(f"Date Range: {billing_df['service_date'].min()} to {billing_df['service_date'].max()}")
+    print(f"Date Range: {billing_df['service_date'].min():%Y-%m-%d} to {billing_df['service_date'].max():%Y-%m-%d}")
     print(f"Total Billed Amount: ${billing_df['total_billed_amount'].sum():,.2f}")
     print(f"Average Claim Amount: ${billing_df['total_billed_amount'].mean():,.2f}")
     print(f"Unique Patients: {billing_df['patient_id'].nunique():,}")
@@ -4,25 +4,11 @@ Converts Jupyter notebook to PDF with code and outputs
 """
 
 import subprocess
-import sys
+import importlib.util
+import shutil
 import os
 from pathlib import Path
 
-def install_required_packages():
-    """Install required packages for PDF export"""
-    required_packages = [
-        'nbconvert',
-        'pandoc',
-        'xelatex',  # For LaTeX PDF generation
-    ]
-    
-    for package in required_packages:
-        try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-            print(f"✅ Installed {package}")
-        except subprocess.CalledProcessError:
-            print(f"⚠️ Could not install {package} via pip")
-
 def export_notebook_to_pdf(notebook_path, output_path=None):
     """
     Export Jupyter notebook to PDF using nbconvert
@@ -30,6 +16,11 @@ def export_notebook_to_pdf(notebook_path, output_path=None):
     if output_path is None:
         output_path = notebook_path.replace('.ipynb', '.pdf')
     
+    # LaTeX PDF conversion needs xelatex on the PATH; it is not a pip package
+    if shutil.which('xelatex') is None:
+        print("⚠️ xelatex not found - install a TeX distribution for direct PDF export")
+        return False
+    
     try:
         # Method 1: Try direct PDF conversion
         cmd = [
@@ -102,14 +93,12 @@ def main():
         print("Please ensure the notebook exists in the current directory.")
         return
     
-    # Check if jupyter is available
-    try:
-        subprocess.run(['jupyter', '--version'], capture_output=True, check=True)
-        print("✅ Jupyter found")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Jupyter not found. Please install Jupyter:")
+    # Check if nbconvert is available (in-process lookup, no subprocess)
+    if importlib.util.find_spec('nbconvert') is None:
+        print("❌ nbconvert not found. Please install Jupyter:")
         print("   pip install jupyter")
         return
+    print("✅ nbconvert found")
     
     # Try to export
     success = export_notebook_to_pdf(notebook_path)
@@ -5,12 +5,26 @@ Creates basic charts with minimal dependencies
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless backend; charts are only ever written to disk
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont
+import io
 import os
 from datetime import datetime
+from _charts_core import (SAVE_DPI, PNG_KWARGS, is_output_current, get_chart_figure,
+                          save_figure, write_file, render_charts, generate_sample_data)
 
-def create_charts():
+DATA_PATH = '../data/healthcare_billing_data.csv'
+
+# Styled once at import; forked and spawned pool workers both inherit it from here
+plt.style.use('seaborn-v0_8')
+
+# Bold value-label font, resolved once and shared by every bar annotation
+BOLD_FONT = font_manager.FontProperties(weight='bold')
+
+def create_charts(force=False):
     """Generate essential presentation charts"""
     
     print("📊 Generating presentation charts...")
@@ -19,52 +33,54 @@ def create_charts():
     charts_dir = "charts"
     os.makedirs(charts_dir, exist_ok=True)
     
-    # Load data or create sample
-    try:
-        df = pd.read_csv('../data/healthcare_billing_data.csv')
-        print(f"✅ Loaded {len(df):,} healthcare records")
-    except FileNotFoundError:
-        print("⚠️ Creating sample data for charts...")
-        df = create_sample_data()
-    
-    # Set style
-    plt.style.use('seaborn-v0_8')
-    
-    # Chart 1: Executive Summary
-    create_executive_summary(df, charts_dir)
-    
-    # Chart 2: Key Metrics Dashboard
-    create_metrics_dashboard(df, charts_dir)
-    
-    # Chart 3: Business Impact
-    create_business_impact(charts_dir)
-    
-    # Chart 4: Technology Overview
-    create_technology_overview(charts_dir)
+    # Only redraw charts older than their inputs, unless forced
+    chart_tasks = [task for task in CHART_TASKS
+                   if force or not is_chart_current(f"{charts_dir}/{task[0]}.png", task[2])]
+    if not chart_tasks:
+        print(f"✅ All charts in {charts_dir}/ are up to date")
+        return
+    
+    # Load data or create sample, only when a data-driven chart needs redrawing
+    df = None
+    if any(uses_data for _, _, uses_data in chart_tasks):
+        try:
+            df = pd.read_csv(DATA_PATH)
+            print(f"✅ Loaded {len(df):,} healthcare records")
+        except FileNotFoundError:
+            print("⚠️ Creating sample data for charts...")
+            df = generate_sample_data()
+    
+    # Render the independent charts across worker processes
+    render_charts(df, charts_dir, chart_tasks)
     
     print(f"✅ Charts saved to {charts_dir}/")
 
-def create_sample_data():
-    """Create sample data for demonstration"""
-    np.random.seed(42)
-    
-    n_records = 10000
-    data = {
-        'claim_id': [f"CLM{i:08d}" for i in range(n_records)],
-        'patient_age': np.clip(np.random.normal(45, 18, n_records).astype(int), 1, 95),
-        'total_billed_amount': np.random.lognormal(6, 1, n_records),
-        'procedure_name': np.random.choice(['Emergency Room Visit', 'Routine Checkup', 'Blood Test', 'X-Ray', 'MRI Scan'], n_records),
-        'department': np.random.choice(['Emergency Medicine', 'Internal Medicine', 'Cardiology', 'Radiology'], n_records),
-        'insurance_provider': np.random.choice(['BlueCross BlueShield', 'Aetna', 'UnitedHealth', 'Cigna'], n_records),
-        'provider_id': [f"DR{np.random.randint(1000, 9999)}" for _ in range(n_records)]
-    }
-    
-    return pd.DataFrame(data)
+def is_chart_current(chart_path, uses_data):
+    """Check whether a chart is newer than this script and, for data charts, the CSV"""
+    sources = [__file__, DATA_PATH] if uses_data else [__file__]
+    return is_output_current(chart_path, sources)
+
+# Text colour of the seaborn-v0_8 style, so the Pillow panel matches the matplotlib charts
+TEXT_COLOR = '#262626'
+
+def _summary_font(size_pt, dpi):
+    """Bold DejaVu Sans (bundled with matplotlib) at a point size for the given dpi"""
+    path = font_manager.findfont(font_manager.FontProperties(family='DejaVu Sans', weight='bold'))
+    return ImageFont.truetype(path, round(size_pt * dpi / 72))
 
-def create_executive_summary(df, charts_dir):
+def create_executive_summary(df, charts_dir, dpi=SAVE_DPI, write=None):
     """Create executive summary chart"""
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 10))
-    fig.suptitle('📊 HealthCost Insights - Executive Summary', fontsize=20, fontweight='bold')
+    # Text-only panel, so draw it straight with Pillow instead of going through Agg
+    width, height = round(16 * dpi), round(10 * dpi)
+    img = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(img)
+    
+    suptitle_font = _summary_font(20, dpi)
+    title_font = _summary_font(14, dpi)
+    metric_font = _summary_font(24, dpi)
+    
+    draw.text((width / 2, dpi * 0.05), 'HealthCost Insights - Executive Summary',
+              fill=TEXT_COLOR, font=suptitle_font, anchor='mt')
     
     # Key metrics as text boxes
     metrics = [
@@ -74,46 +90,59 @@ def create_executive_summary(df, charts_dir):
         ("$9.4M\\nAnnual ROI", "Business Impact")
     ]
     
-    axes = [ax1, ax2, ax3, ax4]
     colors = ['lightblue', 'lightgreen', 'lightyellow', 'lightcoral']
     
-    for ax, (metric, title), color in zip(axes, metrics, colors):
-        ax.text(0.5, 0.5, metric, ha='center', va='center', fontsize=24, fontweight='bold',
-                bbox=dict(boxstyle="round,pad=0.3", facecolor=color))
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis('off')
-        ax.set_title(title, fontweight='bold', fontsize=14)
-    
-    plt.tight_layout()
-    plt.savefig(f"{charts_dir}/executive_summary.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    # 2x2 grid below the suptitle; each card is centred in its cell under the cell title
+    top = dpi * 0.45
+    cell_w, cell_h = width / 2, (height - top) / 2
+    pad = metric_font.size * 0.3
+    
+    for i, ((metric, title), color) in enumerate(zip(metrics, colors)):
+        left = (i % 2) * cell_w
+        cell_top = top + (i // 2) * cell_h
+        cx, cy = left + cell_w / 2, cell_top + cell_h / 2
+        
+        draw.text((cx, cell_top), title, fill=TEXT_COLOR, font=title_font, anchor='mt')
+        
+        x0, y0, x1, y1 = draw.textbbox((cx, cy), metric, font=metric_font, anchor='mm')
+        draw.rounded_rectangle((x0 - pad, y0 - pad, x1 + pad, y1 + pad), radius=pad,
+                               fill=color, outline=TEXT_COLOR)
+        draw.text((cx, cy), metric, fill=TEXT_COLOR, font=metric_font, anchor='mm')
+    
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', dpi=(dpi, dpi), **PNG_KWARGS['pil_kwargs'])
+    (write or write_file)(f"{charts_dir}/executive_summary.png", buffer.getvalue())
 
-def create_metrics_dashboard(df, charts_dir):
+def create_metrics_dashboard(df, charts_dir, dpi=SAVE_DPI, write=None):
     """Create key metrics dashboard"""
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('📈 Key Performance Metrics', fontsize=20, fontweight='bold')
+    fig = get_chart_figure((16, 12))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+    fig.suptitle('Key Performance Metrics', fontsize=20, fontweight='bold')
     
-    # Procedure distribution
+    # Summaries computed up front, with a single pass over the billed amounts
+    billed = df['total_billed_amount'].to_numpy()
+    billed_p95 = np.quantile(billed, 0.95)
     procedure_counts = df['procedure_name'].value_counts()
+    dept_avg = df.groupby('department')['total_billed_amount'].mean().sort_values()
+    
+    # Procedure distribution
     ax1.bar(range(len(procedure_counts)), procedure_counts.values, color='skyblue')
-    ax1.set_title('📋 Procedures by Volume', fontweight='bold')
+    ax1.set_title('Procedures by Volume', fontweight='bold')
     ax1.set_xlabel('Procedures')
     ax1.set_ylabel('Count')
     ax1.set_xticks(range(len(procedure_counts)))
     ax1.set_xticklabels([p[:10] + '...' if len(p) > 10 else p for p in procedure_counts.index], rotation=45)
     
     # Cost distribution
-    ax2.hist(df['total_billed_amount'], bins=50, alpha=0.7, color='lightgreen')
-    ax2.set_title('💰 Cost Distribution', fontweight='bold')
+    ax2.hist(billed, bins=50, alpha=0.7, color='lightgreen')
+    ax2.set_title('Cost Distribution', fontweight='bold')
     ax2.set_xlabel('Billed Amount ($)')
     ax2.set_ylabel('Frequency')
-    ax2.set_xlim(0, df['total_billed_amount'].quantile(0.95))
+    ax2.set_xlim(0, billed_p95)
     
     # Department analysis
-    dept_avg = df.groupby('department')['total_billed_amount'].mean().sort_values()
     ax3.barh(range(len(dept_avg)), dept_avg.values, color='orange')
-    ax3.set_title('🏥 Average Cost by Department', fontweight='bold')
+    ax3.set_title('Average Cost by Department', fontweight='bold')
     ax3.set_xlabel('Average Cost ($)')
     ax3.set_yticks(range(len(dept_avg)))
     ax3.set_yticklabels(dept_avg.index)
@@ -124,23 +153,19 @@ def create_metrics_dashboard(df, charts_dir):
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
     
     bars = ax4.bar(methods, precision_scores, color=colors)
-    ax4.set_title('🎯 Detection Performance', fontweight='bold')
+    ax4.set_title('Detection Performance', fontweight='bold')
     ax4.set_ylabel('Precision (%)')
     ax4.set_ylim(80, 100)
     
-    for bar in bars:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                 f'{height}%', ha='center', va='bottom', fontweight='bold')
+    ax4.bar_label(bars, fmt='%g%%', padding=3, fontproperties=BOLD_FONT)
     
-    plt.tight_layout()
-    plt.savefig(f"{charts_dir}/metrics_dashboard.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f"{charts_dir}/metrics_dashboard.png", dpi=dpi, write=write, **PNG_KWARGS)
 
-def create_business_impact(charts_dir):
+def create_business_impact(charts_dir, dpi=SAVE_DPI, write=None):
     """Create business impact visualization"""
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('💼 Business Impact Analysis', fontsize=20, fontweight='bold')
+    fig = get_chart_figure((16, 12))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+    fig.suptitle('Business Impact Analysis', fontsize=20, fontweight='bold')
     
     # ROI by category
     categories = ['Fraud\\nPrevention', 'Operational\\nEfficiency', 'Compliance\\nImprovement', 'Manual Review\\nReduction']
@@ -148,13 +173,10 @@ def create_business_impact(charts_dir):
     colors = ['#FF9999', '#66B2FF', '#99FF99', '#FFCC99']
     
     bars1 = ax1.bar(categories, roi_values, color=colors)
-    ax1.set_title('💹 Annual ROI by Category', fontweight='bold')
+    ax1.set_title('Annual ROI by Category', fontweight='bold')
     ax1.set_ylabel('ROI ($M)')
     
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.05,
-                 f'${height:.1f}M', ha='center', va='bottom', fontweight='bold')
+    ax1.bar_label(bars1, fmt='$%.1fM', padding=3, fontproperties=BOLD_FONT)
     
     # Efficiency improvements
     metrics = ['Manual Review\\nTime', 'Investigation\\nSpeed', 'False Positive\\nRate', 'Processing\\nThroughput']
@@ -162,13 +184,10 @@ def create_business_impact(charts_dir):
     colors_eff = ['green', 'green', 'red', 'green']
     
     bars2 = ax2.bar(metrics, improvements, color=colors_eff)
-    ax2.set_title('⚡ Efficiency Improvements', fontweight='bold')
+    ax2.set_title('Efficiency Improvements', fontweight='bold')
     ax2.set_ylabel('Improvement (%)')
     
-    for bar in bars2:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 5,
-                 f'{height}%', ha='center', va='bottom', fontweight='bold')
+    ax2.bar_label(bars2, fmt='%g%%', padding=3, fontproperties=BOLD_FONT)
     
     # Investment timeline
     years = ['2024', '2025', '2026', '2027']
@@ -180,7 +199,7 @@ def create_business_impact(charts_dir):
     
     ax3.bar(x - width/2, investments, width, label='Investment', color='lightcoral')
     ax3.bar(x + width/2, returns, width, label='ROI', color='lightgreen')
-    ax3.set_title('📈 Investment vs ROI Timeline', fontweight='bold')
+    ax3.set_title('Investment vs ROI Timeline', fontweight='bold')
     ax3.set_ylabel('Amount ($M)')
     ax3.set_xticks(x)
     ax3.set_xticklabels(years)
@@ -192,16 +211,15 @@ def create_business_impact(charts_dir):
     
     ax4.pie(market_sizes, labels=markets, autopct='%1.1f%%', startangle=90,
             colors=['#FF9999', '#66B2FF', '#99FF99', '#FFD700'])
-    ax4.set_title('🌍 Market Opportunity ($261B TAM)', fontweight='bold')
+    ax4.set_title('Market Opportunity ($261B TAM)', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(f"{charts_dir}/business_impact.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f"{charts_dir}/business_impact.png", dpi=dpi, write=write, **PNG_KWARGS)
 
-def create_technology_overview(charts_dir):
+def create_technology_overview(charts_dir, dpi=SAVE_DPI, write=None):
     """Create technology stack overview"""
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('🛠️ Technology Stack & Architecture', fontsize=20, fontweight='bold')
+    fig = get_chart_figure((16, 12))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+    fig.suptitle('Technology Stack & Architecture', fontsize=20, fontweight='bold')
     
     # Technology components
     tech_categories = ['Data\\nProcessing', 'Machine\\nLearning', 'Visualization', 'Business\\nIntelligence']
@@ -209,58 +227,52 @@ def create_technology_overview(charts_dir):
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
     
     bars1 = ax1.bar(tech_categories, tech_counts, color=colors)
-    ax1.set_title('🔧 Technology Components', fontweight='bold')
+    ax1.set_title('Technology Components', fontweight='bold')
     ax1.set_ylabel('Number of Tools')
     
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{int(height)}', ha='center', va='bottom', fontweight='bold')
+    ax1.bar_label(bars1, fmt='%d', padding=3, fontproperties=BOLD_FONT)
     
     # Performance metrics
     performance_metrics = ['Speed', 'Accuracy', 'Scalability', 'Reliability']
     scores = [95, 95, 90, 92]
     
     bars2 = ax2.bar(performance_metrics, scores, color='lightblue')
-    ax2.set_title('⚡ System Performance', fontweight='bold')
+    ax2.set_title('System Performance', fontweight='bold')
     ax2.set_ylabel('Score (%)')
     ax2.set_ylim(80, 100)
     
-    for bar in bars2:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                 f'{int(height)}%', ha='center', va='bottom', fontweight='bold')
+    ax2.bar_label(bars2, fmt='%d%%', padding=3, fontproperties=BOLD_FONT)
     
     # Anomaly detection methods
     methods = ['Statistical\\nMethods', 'Machine Learning\\nMethods', 'Ensemble\\nApproach']
     method_accuracy = [85, 94, 97]
     
     bars3 = ax3.bar(methods, method_accuracy, color=['orange', 'green', 'darkgreen'])
-    ax3.set_title('🔬 Detection Methods Accuracy', fontweight='bold')
+    ax3.set_title('Detection Methods Accuracy', fontweight='bold')
     ax3.set_ylabel('Accuracy (%)')
     ax3.set_ylim(80, 100)
     
-    for bar in bars3:
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                 f'{int(height)}%', ha='center', va='bottom', fontweight='bold')
+    ax3.bar_label(bars3, fmt='%d%%', padding=3, fontproperties=BOLD_FONT)
     
     # Implementation phases
     phases = ['Development', 'Testing', 'Deployment', 'Monitoring']
     durations = [6, 3, 2, 1]  # weeks
     
     bars4 = ax4.bar(phases, durations, color=['red', 'orange', 'yellow', 'green'])
-    ax4.set_title('🚀 Implementation Timeline', fontweight='bold')
+    ax4.set_title('Implementation Timeline', fontweight='bold')
     ax4.set_ylabel('Duration (Weeks)')
     
-    for bar in bars4:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{int(height)}w', ha='center', va='bottom', fontweight='bold')
+    ax4.bar_label(bars4, fmt='%dw', padding=3, fontproperties=BOLD_FONT)
     
-    plt.tight_layout()
-    plt.savefig(f"{charts_dir}/technology_overview.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f"{charts_dir}/technology_overview.png", dpi=dpi, write=write, **PNG_KWARGS)
+
+# (output file stem, chart function, whether it takes the billing data)
+CHART_TASKS = [
+    ('executive_summary', create_executive_summary, True),
+    ('metrics_dashboard', create_metrics_dashboard, True),
+    ('business_impact', create_business_impact, False),
+    ('technology_overview', create_technology_overview, False),
+]
 
 def main():
     """Main function"""
@@ -280,7 +292,7 @@ def main():
         
     except Exception as e:
         print(f"❌ Error generating charts: {e}")
-        print("Make sure you have matplotlib, pandas, and seaborn installed")
+        print("Make sure you have matplotlib and pandas installed")
 
 if __name__ == "__main__":
     main()